@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
+import itertools
 import json
 import os
 import sys
 import logging
 from http.server import HTTPServer, BaseHTTPRequestHandler
+from botocore.exceptions import ClientError
 
 # Configure logging
 logging.basicConfig(
@@ -54,6 +56,39 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(json.dumps(response_data).encode('utf-8'))
     
+    def _send_ndjson(self, pages):
+        """
+        Stream rows as newline-delimited JSON, writing each page as it arrives
+        
+        The first page is fetched before any headers go out, so an immediate
+        failure (e.g. a missing bucket) is still returned as a normal JSON error.
+        """
+        pages = iter(pages)
+        try:
+            first_page = next(pages, [])
+        except ClientError as e:
+            logger.error(f"Error streaming results: {e}")
+            self._send_response(200, {"status": "error", "message": str(e)})
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Access-Control-Allow-Origin', '*')  # Allow CORS
+        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.end_headers()
+        
+        try:
+            for page in itertools.chain([first_page], pages):
+                self.wfile.write(''.join(json.dumps(row) + '\n' for row in page).encode('utf-8'))
+        except (BrokenPipeError, ConnectionResetError):
+            logger.warning("Client disconnected while streaming results")
+        except Exception as e:
+            # Headers are already sent, so report any failure in-band rather than
+            # letting do_POST write a second status line
+            logger.error(f"Error streaming results: {e}")
+            self.wfile.write((json.dumps({"status": "error", "message": str(e)}) + '\n').encode('utf-8'))
+    
     def do_GET(self):
         """Handle GET requests"""
         try:
@@ -127,6 +162,7 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
         try:
             request = json.loads(post_data)
             logger.info(f"Raw request: {request}")
+            confirmed = False
             
             # Handle both MCP protocol format and original format
             if self.path == '/invoke':
@@ -151,6 +187,7 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
                 # Handle user confirmation for create operations
                 if 'confirmation' in params and params.get('confirmation', '').lower() == 'confirmed':
                     # User has confirmed the operation, proceed with original parameters
+                    confirmed = True
                     # Remove the confirmation parameter
                     original_params = params.copy()
                     original_params.pop('confirmation', None)
@@ -173,6 +210,7 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
                 # Handle user confirmation for create operations
                 if 'confirmation' in params and params.get('confirmation', '').lower() == 'confirmed':
                     # User has confirmed the operation, proceed with original parameters
+                    confirmed = True
                     # Remove the confirmation parameter
                     original_params = params.copy()
                     original_params.pop('confirmation', None)
@@ -196,8 +234,23 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
             # S3 operations
             elif action == 's3_list_buckets':
                 result = self.s3_service.list_buckets()
+            elif action == 's3_list_buckets_detailed':
+                result = self.s3_service.list_buckets_detailed(
+                    params.get('fields', ('location', 'versioning', 'policy'))
+                )
             elif action == 's3_list_objects':
-                result = self.s3_service.list_objects(params.get('bucket_name'), params.get('prefix', ''))
+                result = self.s3_service.list_objects(
+                    params.get('bucket_name'),
+                    params.get('prefix', ''),
+                    params.get('aos', True),
+                    params.get('max_keys'),
+                    params.get('continuation_token')
+                )
+            elif action == 's3_list_objects_parallel':
+                result = self.s3_service.list_objects_parallel(params.get('bucket_name'), params.get('prefix', ''))
+            elif action == 's3_stream_objects':
+                self._send_ndjson(self.s3_service.iter_objects(params.get('bucket_name'), params.get('prefix', '')))
+                return
             elif action == 's3_get_object':
                 result = self.s3_service.get_object(params.get('bucket_name'), params.get('object_key'))
             elif action == 's3_put_object':
@@ -209,12 +262,16 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
                 )
             elif action == 's3_delete_object':
                 result = self.s3_service.delete_object(params.get('bucket_name'), params.get('object_key'))
+            elif action == 's3_delete_objects':
+                result = self.s3_service.delete_objects(params.get('bucket_name'), params.get('object_keys', []))
             elif action == 's3_get_bucket_location':
                 result = self.s3_service.get_bucket_location(params.get('bucket_name'))
             elif action == 's3_get_bucket_policy':
                 result = self.s3_service.get_bucket_policy(params.get('bucket_name'))
             elif action == 's3_get_bucket_versioning':
                 result = self.s3_service.get_bucket_versioning(params.get('bucket_name'))
+            elif action == 's3_get_object_acls':
+                result = self.s3_service.get_object_acls(params.get('bucket_name'), params.get('object_keys', []))
             elif action == 's3_get_bucket_replication':
                 result = self.s3_service.get_bucket_replication(params.get('bucket_name'))
             elif action == 's3_get_object_acl':
@@ -222,7 +279,13 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
             elif action == 's3_create_bucket':
                 result = self.s3_service.create_bucket(params.get('bucket_name'))
             elif action == 's3_delete_bucket':
-                result = self.s3_service.delete_bucket(params.get('bucket_name'))
+                result = self.s3_service.delete_bucket(
+                    params.get('bucket_name'),
+                    params.get('force', False),
+                    confirmed=confirmed
+                )
+            elif action == 's3_empty_bucket':
+                result = self.s3_service.empty_bucket(params.get('bucket_name'), confirmed=confirmed)
             elif action == 's3_create_replication':
                 result = self.s3_service.create_replication(
                     params.get('source_bucket'),
@@ -364,10 +427,18 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
                 result = self.storage_gateway_service.list_gateways()
             elif action == 'storage_gateway_list_volumes':
                 result = self.storage_gateway_service.list_volumes(params.get('gateway_id'))
+            elif action == 'storage_gateway_stream_volumes':
+                self._send_ndjson(self.storage_gateway_service.iter_volumes(params.get('gateway_id')))
+                return
             elif action == 'storage_gateway_describe_gateway':
                 result = self.storage_gateway_service.describe_gateway(params.get('gateway_id'))
+            elif action == 'storage_gateway_describe_gateways':
+                result = self.storage_gateway_service.describe_gateways(params.get('gateway_ids'))
             elif action == 'storage_gateway_list_file_shares':
                 result = self.storage_gateway_service.list_file_shares(params.get('gateway_id'))
+            elif action == 'storage_gateway_stream_file_shares':
+                self._send_ndjson(self.storage_gateway_service.iter_file_shares(params.get('gateway_id')))
+                return
             elif action == 'storage_gateway_create_nfs_file_share':
                 result = self.storage_gateway_service.create_nfs_file_share(
                     params.get('gateway_id'),
@@ -385,6 +456,8 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
                     params.get('name'),
                     params.get('password')
                 )
+            elif action == 'storage_gateway_create_file_shares_bulk':
+                result = self.storage_gateway_service.create_file_shares_bulk(params.get('file_shares', []))
             elif action == 'storage_gateway_delete_file_share':
                 result = self.storage_gateway_service.delete_file_share(params.get('file_share_arn'))
             elif action == 'storage_gateway_create_volume':
@@ -418,8 +491,13 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
             # Snow Family operations
             elif action == 'snow_list_jobs':
                 result = self.snow_service.list_jobs()
+            elif action == 'snow_stream_jobs':
+                self._send_ndjson(self.snow_service.iter_jobs())
+                return
             elif action == 'snow_describe_job':
                 result = self.snow_service.describe_job(params.get('job_id'))
+            elif action == 'snow_describe_jobs':
+                result = self.snow_service.describe_jobs(params.get('job_ids'))
             elif action == 'snow_list_clusters':
                 result = self.snow_service.list_clusters()
             
@@ -501,17 +579,23 @@ if __name__ == "__main__":
             
             # S3 operations
             's3_list_buckets',
+            's3_list_buckets_detailed',
             's3_list_objects',
+            's3_list_objects_parallel',
+            's3_stream_objects',
             's3_get_object',
             's3_put_object',
             's3_delete_object',
+            's3_delete_objects',
             's3_get_bucket_location',
             's3_get_bucket_policy',
             's3_get_bucket_versioning',
             's3_get_bucket_replication',
             's3_get_object_acl',
+            's3_get_object_acls',
             's3_create_bucket',
             's3_delete_bucket',
+            's3_empty_bucket',
             's3_create_replication',
             's3_delete_replication',
             's3_put_bucket_lifecycle_configuration',
@@ -560,10 +644,14 @@ if __name__ == "__main__":
             # Storage Gateway operations
             'storage_gateway_list_gateways',
             'storage_gateway_list_volumes',
+            'storage_gateway_stream_volumes',
             'storage_gateway_describe_gateway',
+            'storage_gateway_describe_gateways',
             'storage_gateway_list_file_shares',
+            'storage_gateway_stream_file_shares',
             'storage_gateway_create_nfs_file_share',
             'storage_gateway_create_smb_file_share',
+            'storage_gateway_create_file_shares_bulk',
             'storage_gateway_delete_file_share',
             'storage_gateway_create_volume',
             
@@ -578,7 +666,9 @@ if __name__ == "__main__":
             
             # Snow Family operations
             'snow_list_jobs',
+            'snow_stream_jobs',
             'snow_describe_job',
+            'snow_describe_jobs',
             'snow_list_clusters',
             
             # AWS Backup operations
@@ -1,36 +1,231 @@
 #!/usr/bin/env python3
+import functools
 import os
 import logging
+import threading
+import time
 import configparser
 import boto3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
 from botocore.exceptions import ClientError, ProfileNotFound
 
 logger = logging.getLogger('aws-storage-mcp')
 
+def _env_seconds(name, default):
+    """Read a timeout in seconds from the environment, falling back to default"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+        return default
+
+# Shared client configuration: a connection pool large enough for the thread
+# pool fan-outs, TCP keep-alive so pooled connections stay usable, bounded
+# timeouts (tunable through AWS_MCP_CONNECT_TIMEOUT and AWS_MCP_READ_TIMEOUT
+# for slow workloads), and adaptive retries: jittered exponential backoff plus
+# a client-side token bucket that slows the whole client down while AWS is
+# throttling it
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    connect_timeout=_env_seconds('AWS_MCP_CONNECT_TIMEOUT', 3),
+    read_timeout=_env_seconds('AWS_MCP_READ_TIMEOUT', 10),
+    retries={'mode': 'adaptive', 'max_attempts': 8}
+)
+
+# Override for mutations that are not safe to repeat many times (e.g. creating a
+# volume): fewer standard-mode retries so failures surface quickly
+_FAIL_FAST_CONFIG = Config(retries={'mode': 'standard', 'max_attempts': 3})
+
+# boto3 sessions are not thread-safe, so client creation is serialized
+_client_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=None)
+def _session_for_profile(profile_name):
+    """
+    Create a boto3 session, memoized per profile
+    
+    Every client built from the same session shares its credential provider,
+    so refreshable credentials (SSO, STS, instance metadata) are resolved and
+    refreshed in one place regardless of the client's region.
+    """
+    return boto3.session.Session(profile_name=profile_name)
+
+# (profile, service, region) -> boto3 client, shared by every service instance
+_clients = {}
+
+def _build_client(profile_name, service_name, region_name, config=None):
+    """
+    Return the boto3 client for (profile, service, region, config), creating it once
+    
+    config is merged over _CLIENT_CONFIG. It is part of the cache key by
+    identity, so overrides should be module-level Config constants. Lookups
+    of existing clients take no lock; only creation is serialized, and the
+    key is checked again under the lock so concurrent first calls cannot
+    build duplicate clients (each with its own connection pool).
+    """
+    key = (profile_name, service_name, region_name, config)
+    client = _clients.get(key)
+    if client is None:
+        with _client_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = _session_for_profile(profile_name).client(
+                    service_name,
+                    region_name=region_name,
+                    config=_CLIENT_CONFIG.merge(config) if config is not None else _CLIENT_CONFIG
+                )
+    return client
+
+# Create operations ask the client for confirmation unless this is set to 0, which
+# is meant for trusted automation where no one is available to confirm
+_CONFIRM_ENABLED = os.environ.get('AWS_STORAGE_MCP_CONFIRM', '1') != '0'
+
+# Profile name -> AWS account ID. The account behind a set of credentials never
+# changes, so it is looked up once per profile instead of on every call.
+_account_ids = {}
+_account_id_lock = threading.Lock()
+
+# Cached read responses, keyed by (profile, region, method, *args), in least to
+# most recently used order. This lives at module level because the HTTP handler
+# creates new service instances per request; it is capped at
+# _RESPONSE_CACHE_SIZE entries so a long-running server touching many buckets,
+# filters or profiles does not grow it without bound.
+_RESPONSE_CACHE_SIZE = 1024
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
 class BaseService:
     """Base class for AWS Storage services"""
     
     def __init__(self, profile_name=None):
         self.region = os.environ.get('AWS_REGION', 'us-east-1')
         self.profile_name = profile_name
+        self._confirm_enabled = _CONFIRM_ENABLED
     
-    def _get_client(self, service_name):
-        """Create and return a boto3 client for the specified service"""
-        if self.profile_name:
-            session = boto3.Session(profile_name=self.profile_name)
-            return session.client(service_name, region_name=self.region)
-        return boto3.client(service_name, region_name=self.region)
+    def _get_client(self, service_name, region=None, fail_fast=False):
+        """
+        Return a boto3 client for the specified service
+        
+        Clients are thread-safe and expensive to build (endpoint resolution,
+        credential lookup, SSL setup), so one is reused per profile, service
+        and region. The service's own region is used unless one is given.
+        Pass fail_fast=True for non-idempotent mutations, which should not be
+        retried as persistently as reads.
+        """
+        config = _FAIL_FAST_CONFIG if fail_fast else None
+        return _build_client(self.profile_name, service_name, region or self.region, config)
+    
+    def _get_account_id(self):
+        """Return the AWS account ID for the current profile, calling STS only once"""
+        account_id = _account_ids.get(self.profile_name)
+        if account_id is None:
+            with _account_id_lock:
+                account_id = _account_ids.get(self.profile_name)
+                if account_id is None:
+                    identity = self._get_client('sts').get_caller_identity()
+                    account_id = _account_ids[self.profile_name] = identity['Account']
+        return account_id
+    
+    def _get_session(self):
+        """Return the shared boto3 session for the current profile"""
+        return _session_for_profile(self.profile_name)
     
     def _get_resource(self, service_name):
         """Create and return a boto3 resource for the specified service"""
-        if self.profile_name:
-            session = boto3.Session(profile_name=self.profile_name)
-            return session.resource(service_name, region_name=self.region)
-        return boto3.resource(service_name, region_name=self.region)
+        # Resources are not thread-safe, so only the session is shared
+        with _client_lock:
+            return self._get_session().resource(service_name, region_name=self.region, config=_CLIENT_CONFIG)
+    
+    def _parallel_describe(self, ids, describe, result_key, max_workers=20):
+        """
+        Call a per-resource describe method for many IDs concurrently
         
+        describe is a service method that handles its own ClientError and
+        returns a status dict, so one failing ID does not abort the batch.
+        
+        Returns:
+            tuple: (results, errors) dicts keyed by ID, holding describe's
+                   result_key value or error message respectively
+        """
+        results = {}
+        errors = {}
+        ids = list(ids)
+        if ids:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(ids))) as executor:
+                for resource_id, result in zip(ids, executor.map(describe, ids)):
+                    if result['status'] == 'success':
+                        results[resource_id] = result[result_key]
+                    else:
+                        errors[resource_id] = result['message']
+        return results, errors
+    
+    def _cached(self, key, ttl, fetch):
+        """
+        Return the response from fetch(), reusing it for ttl seconds
+        
+        Args:
+            key (tuple): Cache key, e.g. ('get_bucket_policy', bucket_name)
+            ttl (float): Seconds a cached response stays fresh
+            fetch (callable): Returns a success response dict, raises ClientError on failure
+            
+        An expired response is dropped when it is next looked up. If fetch()
+        then fails with anything other than a NoSuch* error, that response is
+        returned flagged "stale": True instead of raising, and kept as the
+        fallback until a refresh succeeds. The least recently used responses
+        are evicted once the cache holds _RESPONSE_CACHE_SIZE entries.
+        """
+        key = (self.profile_name, self.region) + key
+        now = time.monotonic()
+        with _response_cache_lock:
+            entry = _response_cache.get(key)
+            if entry is not None:
+                if now - entry[0] < ttl:
+                    _response_cache.move_to_end(key)
+                    return entry[1]
+                del _response_cache[key]
+        
+        try:
+            response = fetch()
+        except ClientError as e:
+            if entry is None or e.response['Error']['Code'].startswith('NoSuch'):
+                raise
+            logger.warning(f"Serving stale {key[2]} response after error: {e}")
+            self._cache_store(key, entry)
+            return {**entry[1], "stale": True}
+        
+        self._cache_store(key, (now, response))
+        return response
+    
+    def _cache_store(self, key, entry):
+        """Insert a cache entry as most recently used, evicting the least recently used"""
+        with _response_cache_lock:
+            _response_cache[key] = entry
+            _response_cache.move_to_end(key)
+            while len(_response_cache) > _RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
+    
+    def _invalidate(self, *keys):
+        """Drop cached responses for the given keys after a mutating call"""
+        with _response_cache_lock:
+            for key in keys:
+                _response_cache.pop((self.profile_name, self.region) + key, None)
+    
+    def _invalidate_all(self, *methods):
+        """Drop every cached response of the given methods, whatever their arguments"""
+        scope = (self.profile_name, self.region)
+        with _response_cache_lock:
+            for key in [key for key in _response_cache if key[:2] == scope and key[2] in methods]:
+                del _response_cache[key]
+    
     def _request_confirmation(self, operation_type, resource_type, params=None):
         """
-        Request user confirmation before creating resources
+        Request user confirmation before creating resources or permanently deleting data
         
         Args:
             operation_type (str): Type of operation (create, delete, etc.)
@@ -41,16 +236,25 @@ class BaseService:
             dict: Response with status and message
                   If status is "input_needed", the client should prompt for confirmation
         """
-        # For create operations, always request confirmation
-        if operation_type.lower() == "create":
+        if not self._confirm_enabled:
+            return None
+        
+        # For create and delete operations, always request confirmation
+        operation = operation_type.lower()
+        if operation in ("create", "delete"):
             param_str = ""
             if params:
                 param_str = ", ".join([f"{k}: {v}" for k, v in params.items()])
             
+            if operation == "create":
+                message = f"Please confirm you want to create a new {resource_type} with parameters: {param_str}"
+            else:
+                message = f"Please confirm you want to permanently delete {resource_type} with parameters: {param_str}"
+            
             return {
                 "status": "input_needed",
                 "input_type": "confirmation",
-                "message": f"Please confirm you want to create a new {resource_type} with parameters: {param_str}",
+                "message": message,
                 "operation": operation_type,
                 "resource_type": resource_type,
                 "parameters": params
@@ -89,8 +293,8 @@ class BaseService:
     def set_profile(self, profile_name):
         """Set the AWS profile to use for subsequent operations"""
         try:
-            # Test if profile exists
-            session = boto3.Session(profile_name=profile_name)
+            # Test if profile exists (this also caches its session)
+            _session_for_profile(profile_name)
             # If we get here, profile exists
             self.profile_name = profile_name
             return {"status": "success", "message": f"AWS profile set to {profile_name}"}
@@ -1,63 +1,541 @@
 #!/usr/bin/env python3
+import codecs
+import io
+import itertools
 import json
 import logging
-import uuid
-from botocore.exceptions import ClientError
+import operator
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError, WaiterError
 from .base import BaseService
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger('aws-storage-mcp')
 
+# orjson parses and serializes several times faster than the stdlib json module
+if orjson is not None:
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# Trust policy letting S3 assume the replication role; it never changes, so it is serialized once
+_TRUST_POLICY_JSON = _json_dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Principal": {"Service": "s3.amazonaws.com"},
+            "Action": "sts:AssumeRole"
+        }
+    ]
+})
+
+# Replication role permissions, pre-serialized with %s placeholders for
+# (source_bucket, source_bucket, destination_bucket). Bucket names cannot
+# contain characters that need JSON escaping, so plain substitution is safe.
+_REPLICATION_POLICY_TEMPLATE = _json_dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Action": [
+                "s3:GetReplicationConfiguration",
+                "s3:ListBucket"
+            ],
+            "Resource": [
+                "arn:aws:s3:::%s"
+            ]
+        },
+        {
+            "Effect": "Allow",
+            "Action": [
+                "s3:GetObjectVersion",
+                "s3:GetObjectVersionAcl"
+            ],
+            "Resource": [
+                "arn:aws:s3:::%s/*"
+            ]
+        },
+        {
+            "Effect": "Allow",
+            "Action": [
+                "s3:ReplicateObject",
+                "s3:ReplicateDelete"
+            ],
+            "Resource": "arn:aws:s3:::%s/*"
+        }
+    ]
+})
+
+# How long cached bucket metadata stays fresh, in seconds
+_LIST_BUCKETS_TTL = 60
+_VERSIONING_TTL = 30
+_POLICY_TTL = 10
+_REPLICATION_TTL = 10
+_LIFECYCLE_TTL = 30
+_PUBLIC_ACCESS_BLOCK_TTL = 30
+
+# get_object only returns bodies below this size inline; larger ones are never read
+_MAX_INLINE_CONTENT = 1024 * 1024
+_GET_OBJECT_CHUNK_SIZE = 64 * 1024
+
+# put_object bodies above this size are sent as a parallel multipart upload
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=_MULTIPART_THRESHOLD,
+    multipart_chunksize=_MULTIPART_THRESHOLD,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# Bucket name -> region. A bucket's region never changes, so entries are kept
+# for the life of the process and only dropped when the bucket is deleted.
+_bucket_regions = {}
+
+# Upper bound, in seconds, on waiting for a new replication role to become usable
+_ROLE_PROPAGATION_TIMEOUT = 15
+
+# Errors PutBucketReplication returns while S3 cannot yet see or assume a new
+# role. The generic codes also cover real configuration errors (e.g. an
+# unversioned destination), so they only count when the message names the role.
+_ROLE_NOT_READY_ERROR_CODES = frozenset({'MalformedPolicy'})
+_ROLE_MENTIONING_ERROR_CODES = frozenset({'InvalidArgument', 'InvalidRequest'})
+
+def _role_not_ready(error):
+    """Return True if a PutBucketReplication error means the new role is not usable yet"""
+    code = error.get('Code')
+    return code in _ROLE_NOT_READY_ERROR_CODES or (
+        code in _ROLE_MENTIONING_ERROR_CODES and 'role' in error.get('Message', '').lower()
+    )
+
+def _rand_tag():
+    """Return a short random hex suffix for generated resource names"""
+    return os.urandom(4).hex()
+
+def _iso(dt):
+    """Format an optional datetime as ISO 8601, passing None through"""
+    return dt.isoformat() if dt is not None else None
+
+_bucket_fields = operator.itemgetter('Name', 'CreationDate')
+
+def _bucket_rows(buckets):
+    """Convert ListBuckets entries into a list of row dicts"""
+    return [{"name": name, "creation_date": creation_date.isoformat()}
+            for name, creation_date in map(_bucket_fields, buckets)]
+
+_object_fields = operator.itemgetter('Key', 'Size', 'LastModified')
+
+def _object_rows(contents):
+    """
+    Convert ListObjectsV2 entries into a list of row dicts
+    
+    S3 reports LastModified with whole-second precision, so timespec='seconds'
+    produces the same text as a plain isoformat() with less work.
+    """
+    return [{"key": key, "size": size, "last_modified": last_modified.isoformat(timespec='seconds')}
+            for key, size, last_modified in map(_object_fields, contents)]
+
+def _new_object_columns():
+    """Return an empty columnar list_objects result"""
+    return {"keys": [], "sizes": [], "last_modified": []}
+
+def _extend_object_columns(columns, contents):
+    """Append ListObjectsV2 entries to a columnar list_objects result"""
+    if contents:
+        keys, sizes, modified = zip(*map(_object_fields, contents))
+        columns["keys"].extend(keys)
+        columns["sizes"].extend(sizes)
+        columns["last_modified"].extend(dt.isoformat(timespec='seconds') for dt in modified)
+    return columns
+
+# Content types that are never displayable text. Generic types such as
+# binary/octet-stream are not listed because S3 assigns them to text uploaded
+# without a content type, so those bodies still have to be inspected.
+_BINARY_CONTENT_TYPE_PREFIXES = (
+    'image/', 'audio/', 'video/', 'font/',
+    'application/zip', 'application/gzip', 'application/x-gzip',
+    'application/x-tar', 'application/x-7z-compressed', 'application/pdf',
+    'application/vnd.apache.parquet', 'application/x-parquet',
+)
+
+def _is_binary_content_type(content_type):
+    """Whether a Content-Type alone shows the object is not displayable text"""
+    return bool(content_type) and content_type.lower().startswith(_BINARY_CONTENT_TYPE_PREFIXES)
+
+def _fits_inline(response):
+    """Whether a GetObject body may be small enough to return inline"""
+    content_length = response.get('ContentLength')
+    return content_length is None or content_length < _MAX_INLINE_CONTENT
+
+class _TextBodyReader:
+    """
+    Incrementally decode an object body as UTF-8 while it streams in
+    
+    Reading stops as soon as the body turns out to be binary or to exceed the
+    inline size limit, so neither case downloads or decodes the whole object.
+    """
+    
+    def __init__(self, is_text=True):
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._parts = []
+        self._bytes_read = 0
+        self.is_text = is_text
+        self.too_large = False
+    
+    def feed(self, chunk):
+        """Decode the next chunk; returns False once the rest can be skipped"""
+        self._bytes_read += len(chunk)
+        if self._bytes_read >= _MAX_INLINE_CONTENT:
+            self.too_large = True
+            return False
+        try:
+            self._parts.append(self._decoder.decode(chunk))
+        except UnicodeDecodeError:
+            self.is_text = False
+            return False
+        return True
+    
+    def finish(self):
+        """Flush the decoder once the whole body has been fed"""
+        try:
+            self._parts.append(self._decoder.decode(b'', final=True))
+        except UnicodeDecodeError:
+            self.is_text = False
+    
+    @property
+    def text(self):
+        return ''.join(self._parts) if self.is_text and not self.too_large else None
+
+def _object_result(response, reader):
+    """
+    Build the get_object response from GetObject metadata and the decoded body
+    
+    reader is None when the body was skipped without reading it.
+    """
+    too_large = reader is None or reader.too_large
+    content_str = None if reader is None else reader.text
+    result = {
+        "status": "success",
+        "metadata": {
+            "content_type": response.get('ContentType'),
+            "content_length": response.get('ContentLength'),
+            "last_modified": _iso(response.get('LastModified')),
+            "etag": response.get('ETag'),
+            "is_text": None if too_large else reader.is_text
+        }
+    }
+    
+    # Include content if it's text and not too large
+    if content_str is not None:
+        result["content"] = content_str
+    elif too_large:
+        result["message"] = "Content too large to display (> 1MB). Use a more specific operation to download."
+    else:
+        result["message"] = "Binary content. Use a more specific operation to download."
+    return result
+
+def _deletion_result(bucket_name, deleted_count, errors):
+    """Build the response for a bulk delete from its counts and per-key errors"""
+    if errors:
+        return {
+            "status": "error",
+            "message": f"{len(errors)} object(s) could not be deleted from bucket {bucket_name}",
+            "deleted_count": deleted_count,
+            "errors": errors
+        }
+    return {
+        "status": "success",
+        "message": f"{deleted_count} object(s) deleted from bucket {bucket_name} successfully",
+        "deleted_count": deleted_count
+    }
+
+_ALL_USERS_URI = 'http://acs.amazonaws.com/groups/global/AllUsers'
+_AUTHENTICATED_USERS_URI = 'http://acs.amazonaws.com/groups/global/AuthenticatedUsers'
+_LOG_DELIVERY_URI = 'http://acs.amazonaws.com/groups/s3/LogDelivery'
+
+# Grants each canned bucket ACL adds on top of the owner's FULL_CONTROL
+_CANNED_ACL_GRANTS = {
+    frozenset(): 'private',
+    frozenset({(_ALL_USERS_URI, 'READ')}): 'public-read',
+    frozenset({(_ALL_USERS_URI, 'READ'), (_ALL_USERS_URI, 'WRITE')}): 'public-read-write',
+    frozenset({(_AUTHENTICATED_USERS_URI, 'READ')}): 'authenticated-read',
+    frozenset({(_LOG_DELIVERY_URI, 'WRITE'), (_LOG_DELIVERY_URI, 'READ_ACP')}): 'log-delivery-write',
+}
+
+def _canned_acl(acl_response):
+    """Return the canned ACL a GetBucketAcl response corresponds to, or None if it is custom"""
+    owner_id = acl_response.get('Owner', {}).get('ID')
+    grants = set()
+    owner_full_control = False
+    for grant in acl_response.get('Grants', []):
+        grantee = grant.get('Grantee') or {}
+        permission = grant.get('Permission')
+        if grantee.get('Type') == 'Group':
+            grants.add((grantee.get('URI'), permission))
+        elif grantee.get('ID') == owner_id and permission == 'FULL_CONTROL':
+            owner_full_control = True
+        else:
+            return None
+    return _CANNED_ACL_GRANTS.get(frozenset(grants)) if owner_full_control else None
+
+def _grant_rows(grants):
+    """Convert GetObjectAcl grants into the response shape"""
+    return [{
+        "permission": grant.get('Permission'),
+        "grantee_type": (grantee := grant.get('Grantee') or {}).get('Type'),
+        "grantee_id": grantee.get('ID', ''),
+        "display_name": grantee.get('DisplayName', '')
+    } for grant in grants]
+
 class S3Service(BaseService):
     """Handler for Amazon S3 operations"""
     
+    def __init__(self, profile_name=None):
+        super().__init__(profile_name)
+        # Different create_bucket syntax for us-east-1, which rejects an explicit
+        # LocationConstraint. The region is fixed per instance, so resolve it once.
+        if self.region == 'us-east-1':
+            self._create_bucket_kwargs = {}
+        else:
+            self._create_bucket_kwargs = {'CreateBucketConfiguration': {'LocationConstraint': self.region}}
+    
     def list_buckets(self):
         """List all S3 buckets"""
-        try:
+        def fetch():
             s3_client = self._get_client('s3')
             response = s3_client.list_buckets()
-            buckets = [{"name": bucket['Name'], "creation_date": bucket['CreationDate'].isoformat()} 
-                      for bucket in response['Buckets']]
+            buckets = _bucket_rows(response['Buckets'])
             return {"status": "success", "buckets": buckets}
+        
+        try:
+            return self._cached(('list_buckets',), _LIST_BUCKETS_TTL, fetch)
         except ClientError as e:
-            logger.error(f"Error listing S3 buckets: {e}")
+            logger.error("Error listing S3 buckets: %s", e)
             return {"status": "error", "message": str(e)}
     
-    def list_objects(self, bucket_name, prefix=""):
-        """List objects in an S3 bucket with optional prefix"""
+    def list_buckets_detailed(self, fields=("location", "versioning", "policy"), max_workers=64):
+        """
+        List all S3 buckets along with per-bucket metadata
+        
+        The per-bucket lookups are issued concurrently, so the wall-clock cost is
+        roughly one round trip per max_workers buckets rather than one per bucket.
+        
+        Args:
+            fields (list): Metadata to fetch for each bucket - any of "location", "versioning", "policy"
+            max_workers (int): Maximum number of concurrent metadata requests
+        """
+        getters = {
+            "location": self.get_bucket_location,
+            "versioning": self.get_bucket_versioning,
+            "policy": self.get_bucket_policy
+        }
+        unknown = [field for field in fields if field not in getters]
+        if unknown:
+            return {"status": "error", "message": f"Unsupported fields: {', '.join(unknown)}. Use any of: {', '.join(getters)}"}
+        
+        result = self.list_buckets()
+        if result['status'] != 'success' or not result['buckets'] or not fields:
+            return result
+        # Copy the rows so the cached list_buckets response is not mutated
+        buckets = [dict(bucket) for bucket in result['buckets']]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(buckets) * len(fields))) as executor:
+            futures = {
+                executor.submit(getters[field], bucket['name']): (bucket, field)
+                for bucket in buckets for field in fields
+            }
+            for future in as_completed(futures):
+                bucket, field = futures[future]
+                field_result = future.result()
+                if field_result['status'] == 'success':
+                    bucket[field] = field_result[field]
+                else:
+                    bucket.setdefault('errors', {})[field] = field_result['message']
+        
+        return {"status": "success", "buckets": buckets}
+    
+    def list_objects(self, bucket_name, prefix="", aos=True, max_keys=None, continuation_token=None):
+        """
+        List objects in an S3 bucket with optional prefix
+        
+        By default every result page is fetched and the complete listing is
+        returned. Pass max_keys and/or continuation_token to fetch a single page
+        instead; "next_continuation_token" is included while more keys remain.
+        
+        Args:
+            bucket_name (str): Name of the S3 bucket
+            prefix (str): Optional key prefix to filter by
+            aos (bool): Return a list of per-object dicts under "objects" (default).
+                        If False, return parallel "keys", "sizes" and "last_modified"
+                        lists instead, which is much more compact for large listings.
+            max_keys (int): Maximum number of keys to return in a single page
+            continuation_token (str): Token from a previous call to continue from
+        """
         try:
-            s3_client = self._get_client('s3')
-            response = s3_client.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
+            next_token = None
+            if max_keys is not None or continuation_token:
+                params = {'Bucket': bucket_name, 'Prefix': prefix}
+                if max_keys is not None:
+                    params['MaxKeys'] = max_keys
+                if continuation_token:
+                    params['ContinuationToken'] = continuation_token
+                response = self._get_client('s3').list_objects_v2(**params)
+                pages = [response.get('Contents', [])]
+                next_token = response.get('NextContinuationToken')
+            else:
+                pages = self._iter_object_pages(bucket_name, prefix)
+            
+            if aos:
+                result = {"status": "success", "objects": list(itertools.chain.from_iterable(map(_object_rows, pages)))}
+            else:
+                columns = _new_object_columns()
+                for contents in pages:
+                    _extend_object_columns(columns, contents)
+                result = {"status": "success", **columns}
+            
+            if next_token:
+                result["next_continuation_token"] = next_token
+            return result
+        except ClientError as e:
+            logger.error("Error listing objects in bucket %s: %s", bucket_name, e)
+            return {"status": "error", "message": str(e)}
+    
+    def list_objects_parallel(self, bucket_name, prefix="", max_workers=32):
+        """
+        List every object under a prefix, listing sub-prefixes concurrently
+        
+        A sequential listing costs one round trip per 1000 keys. Here any prefix
+        holding more than one page of keys is split into its '/' sub-prefixes,
+        which are then listed in parallel (recursively), so large buckets with a
+        folder-like layout are listed with many requests in flight at once.
+        
+        Args:
+            bucket_name (str): Name of the S3 bucket
+            prefix (str): Optional key prefix to filter by
+            max_workers (int): Maximum number of concurrent list requests
             
-            if 'Contents' in response:
-                objects = [{"key": obj['Key'], "size": obj['Size'], "last_modified": obj['LastModified'].isoformat()} 
-                          for obj in response['Contents']]
-                return {"status": "success", "objects": objects}
-            return {"status": "success", "objects": []}
+        Returns objects in the same shape as list_objects, sorted by key.
+        """
+        try:
+            objects = []
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = {executor.submit(self._list_prefix, bucket_name, prefix)}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        contents, sub_prefixes, start_after = future.result()
+                        objects.extend(_object_rows(contents))
+                        pending.update(
+                            executor.submit(self._list_prefix, bucket_name, sub_prefix, start_after)
+                            for sub_prefix in sub_prefixes
+                        )
+            objects.sort(key=operator.itemgetter('key'))
+            return {"status": "success", "objects": objects}
         except ClientError as e:
-            logger.error(f"Error listing objects in bucket {bucket_name}: {e}")
+            logger.error("Error listing objects in bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     
+    def _list_prefix(self, bucket_name, prefix, start_after=''):
+        """
+        List one prefix for list_objects_parallel
+        
+        Returns (contents, sub_prefixes, start_after). A prefix that fits in a
+        single page is returned in full with no sub-prefixes. For a larger one
+        the first page is kept, and the rest of the prefix is listed with '/' as
+        delimiter from after that page's last key: this returns the remaining
+        objects directly under the prefix plus its '/' sub-prefixes, for the
+        caller to list concurrently from the returned start_after key. Keys up
+        to start_after have already been listed by a parent prefix.
+        """
+        s3_client = self._get_client('s3')
+        params = {'Bucket': bucket_name, 'Prefix': prefix}
+        if start_after:
+            params['StartAfter'] = start_after
+        response = s3_client.list_objects_v2(**params)
+        contents = response.get('Contents', [])
+        if not response.get('IsTruncated'):
+            return contents, [], start_after
+        
+        params['StartAfter'] = start_after = contents[-1]['Key']
+        sub_prefixes = []
+        paginator = s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Delimiter='/', **params):
+            contents.extend(page.get('Contents', []))
+            sub_prefixes.extend(common['Prefix'] for common in page.get('CommonPrefixes', []))
+        return contents, sub_prefixes, start_after
+    
+    def iter_objects(self, bucket_name, prefix=""):
+        """Yield the object rows under a prefix one ListObjectsV2 page at a time"""
+        for contents in self._iter_object_pages(bucket_name, prefix):
+            yield _object_rows(contents)
+    
+    def _iter_object_pages(self, bucket_name, prefix):
+        """Yield the raw Contents list of each ListObjectsV2 page"""
+        s3_client = self._get_client('s3')
+        paginator = s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(Bucket=bucket_name, Prefix=prefix, PaginationConfig={'PageSize': 1000})
+        for page in pages:
+            yield page.get('Contents', [])
+    
     def get_bucket_location(self, bucket_name):
         """Get the region where a bucket is located"""
         try:
-            s3_client = self._get_client('s3')
-            response = s3_client.get_bucket_location(Bucket=bucket_name)
-            location = response.get('LocationConstraint') or 'us-east-1'  # Default to us-east-1 if None
-            return {"status": "success", "location": location}
+            return {"status": "success", "location": self._bucket_region(bucket_name)}
         except ClientError as e:
-            logger.error(f"Error getting location for bucket {bucket_name}: {e}")
+            logger.error("Error getting location for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     
+    def _bucket_region(self, bucket_name):
+        """
+        Return the region a bucket lives in, cached for the life of the process
+        
+        HeadBucket reports the region in the x-amz-bucket-region header, even on
+        403 responses, and does not need the s3:GetBucketLocation permission.
+        GetBucketLocation is only used when that header is missing. Raises
+        ClientError if the region cannot be determined.
+        """
+        region = _bucket_regions.get(bucket_name)
+        if region is None:
+            s3_client = self._get_client('s3')
+            try:
+                response = s3_client.head_bucket(Bucket=bucket_name)
+            except ClientError as e:
+                response = e.response
+            region = response.get('ResponseMetadata', {}).get('HTTPHeaders', {}).get('x-amz-bucket-region')
+            if not region:
+                response = s3_client.get_bucket_location(Bucket=bucket_name)
+                region = response.get('LocationConstraint') or 'us-east-1'  # Default to us-east-1 if None
+            _bucket_regions[bucket_name] = region
+        return region
+    
     def get_bucket_policy(self, bucket_name):
         """Get the policy for an S3 bucket"""
-        try:
+        def fetch():
             s3_client = self._get_client('s3')
-            response = s3_client.get_bucket_policy(Bucket=bucket_name)
-            return {"status": "success", "policy": json.loads(response['Policy'])}
+            try:
+                response = s3_client.get_bucket_policy(Bucket=bucket_name)
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'NoSuchBucketPolicy':
+                    return {"status": "success", "policy": None, "message": "No policy exists for this bucket"}
+                raise
+            return {"status": "success", "policy": _json_loads(response['Policy'])}
+        
+        try:
+            return self._cached(('get_bucket_policy', bucket_name), _POLICY_TTL, fetch)
         except ClientError as e:
-            if e.response['Error']['Code'] == 'NoSuchBucketPolicy':
-                return {"status": "success", "policy": None, "message": "No policy exists for this bucket"}
-            logger.error(f"Error getting policy for bucket {bucket_name}: {e}")
+            logger.error("Error getting policy for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     
     def create_bucket(self, bucket_name):
@@ -74,28 +552,41 @@ class S3Service(BaseService):
             
         try:
             s3_client = self._get_client('s3')
-            
-            # Different create_bucket syntax for us-east-1
-            if self.region == 'us-east-1':
-                response = s3_client.create_bucket(Bucket=bucket_name)
-            else:
-                response = s3_client.create_bucket(
-                    Bucket=bucket_name,
-                    CreateBucketConfiguration={'LocationConstraint': self.region}
-                )
+            s3_client.create_bucket(Bucket=bucket_name, **self._create_bucket_kwargs)
+            self._invalidate(('list_buckets',))
             return {"status": "success", "message": f"Bucket {bucket_name} created successfully"}
         except ClientError as e:
-            logger.error(f"Error creating bucket {bucket_name}: {e}")
+            logger.error("Error creating bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     
-    def delete_bucket(self, bucket_name):
-        """Delete an S3 bucket"""
+    def delete_bucket(self, bucket_name, force=False, confirmed=False):
+        """
+        Delete an S3 bucket
+        
+        Args:
+            bucket_name (str): Name of the S3 bucket
+            force (bool): Empty the bucket first, since only empty buckets can be deleted
+            confirmed (bool): Whether the user already confirmed emptying the bucket
+        """
+        if force:
+            result = self.empty_bucket(bucket_name, confirmed=confirmed)
+            if result['status'] != 'success':
+                return result
         try:
             s3_client = self._get_client('s3')
             s3_client.delete_bucket(Bucket=bucket_name)
+            _bucket_regions.pop(bucket_name, None)
+            self._invalidate(
+                ('list_buckets',),
+                ('get_bucket_versioning', bucket_name),
+                ('get_bucket_policy', bucket_name),
+                ('get_bucket_replication', bucket_name),
+                ('get_bucket_lifecycle_configuration', bucket_name),
+                ('get_public_access_block', bucket_name)
+            )
             return {"status": "success", "message": f"Bucket {bucket_name} deleted successfully"}
         except ClientError as e:
-            logger.error(f"Error deleting bucket {bucket_name}: {e}")
+            logger.error("Error deleting bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     
     def get_object_acl(self, bucket_name, object_key):
@@ -103,30 +594,61 @@ class S3Service(BaseService):
         try:
             s3_client = self._get_client('s3')
             response = s3_client.get_object_acl(Bucket=bucket_name, Key=object_key)
-            grants = []
-            for grant in response.get('Grants', []):
-                grantee = grant.get('Grantee', {})
-                grants.append({
-                    "permission": grant.get('Permission'),
-                    "grantee_type": grantee.get('Type'),
-                    "grantee_id": grantee.get('ID', ''),
-                    "display_name": grantee.get('DisplayName', '')
-                })
+            grants = _grant_rows(response.get('Grants', ()))
             return {"status": "success", "grants": grants}
         except ClientError as e:
-            logger.error(f"Error getting ACL for object {object_key} in bucket {bucket_name}: {e}")
+            logger.error("Error getting ACL for object %s in bucket %s: %s", object_key, bucket_name, e)
             return {"status": "error", "message": str(e)}
     
+    def get_object_acls(self, bucket_name, object_keys, max_workers=64):
+        """
+        Get the ACLs for many objects in an S3 bucket
+        
+        Requests are issued concurrently, so the cost is roughly one round trip
+        per max_workers keys instead of one per key. Throttled requests are
+        retried by the client's adaptive retry mode.
+        
+        Args:
+            bucket_name (str): Name of the S3 bucket
+            object_keys (list): Keys of the objects to inspect
+            max_workers (int): Maximum number of concurrent requests (e.g. 32, 64, 128)
+        """
+        acls = {}
+        errors = {}
+        if object_keys:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(object_keys))) as executor:
+                futures = {
+                    executor.submit(self.get_object_acl, bucket_name, object_key): object_key
+                    for object_key in object_keys
+                }
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result['status'] == 'success':
+                        acls[futures[future]] = result['grants']
+                    else:
+                        errors[futures[future]] = result['message']
+        
+        result = {"status": "success", "acls": acls}
+        if errors:
+            result["errors"] = errors
+        return result
+    
     def get_bucket_replication(self, bucket_name):
         """Get replication configuration for an S3 bucket"""
-        try:
+        def fetch():
             s3_client = self._get_client('s3')
-            response = s3_client.get_bucket_replication(Bucket=bucket_name)
+            try:
+                response = s3_client.get_bucket_replication(Bucket=bucket_name)
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'ReplicationConfigurationNotFoundError':
+                    return {"status": "success", "replication_config": None, "message": "No replication configuration exists for this bucket"}
+                raise
             return {"status": "success", "replication_config": response.get('ReplicationConfiguration', {})}
+        
+        try:
+            return self._cached(('get_bucket_replication', bucket_name), _REPLICATION_TTL, fetch)
         except ClientError as e:
-            if e.response['Error']['Code'] == 'ReplicationConfigurationNotFoundError':
-                return {"status": "success", "replication_config": None, "message": "No replication configuration exists for this bucket"}
-            logger.error(f"Error getting replication configuration for bucket {bucket_name}: {e}")
+            logger.error("Error getting replication configuration for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     
     def create_replication(self, source_bucket, destination_bucket, destination_region=None, prefix=None, replication_type="CRR"):
@@ -163,141 +685,107 @@ class S3Service(BaseService):
             
         try:
             s3_client = self._get_client('s3')
-            
-            # Get source bucket location
-            source_location_response = s3_client.get_bucket_location(Bucket=source_bucket)
-            source_region = source_location_response.get('LocationConstraint') or 'us-east-1'
-            
-            # Determine destination region
-            if not destination_region:
-                if replication_type == "CRR":
-                    # For CRR, use a different region than source
-                    destination_region = 'us-west-2' if source_region != 'us-west-2' else 'us-east-1'
-                else:
-                    # For SRR, use the same region as source
-                    destination_region = source_region
-            
-            # Enable versioning on source bucket (required for replication)
-            s3_client.put_bucket_versioning(
-                Bucket=source_bucket,
-                VersioningConfiguration={'Status': 'Enabled'}
-            )
-            
-            # Enable versioning on destination bucket (required for replication)
-            dest_s3_client = self._get_client('s3') if destination_region == source_region else boto3.client(
-                's3', 
-                region_name=destination_region,
-                aws_access_key_id=s3_client._request_signer._credentials.access_key,
-                aws_secret_access_key=s3_client._request_signer._credentials.secret_key,
-                aws_session_token=s3_client._request_signer._credentials.token
-            )
-            
-            dest_s3_client.put_bucket_versioning(
-                Bucket=destination_bucket,
-                VersioningConfiguration={'Status': 'Enabled'}
-            )
-            
-            # Create IAM role for replication
-            role_name = f"s3-replication-role-{uuid.uuid4().hex[:8]}"
             iam_client = self._get_client('iam')
+            role_name = f"s3-replication-role-{_rand_tag()}"
+            policy_name = f"s3-replication-policy-{_rand_tag()}"
             
-            # Create trust policy for S3 service
-            trust_policy = {
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Effect": "Allow",
-                        "Principal": {"Service": "s3.amazonaws.com"},
-                        "Action": "sts:AssumeRole"
-                    }
-                ]
-            }
-            
-            # Create the IAM role
-            role_response = iam_client.create_role(
-                RoleName=role_name,
-                AssumeRolePolicyDocument=json.dumps(trust_policy)
-            )
-            
-            role_arn = role_response['Role']['Arn']
-            
-            # Create policy document for replication permissions
-            policy_document = {
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Effect": "Allow",
-                        "Action": [
-                            "s3:GetReplicationConfiguration",
-                            "s3:ListBucket"
-                        ],
-                        "Resource": [
-                            f"arn:aws:s3:::{source_bucket}"
-                        ]
-                    },
-                    {
-                        "Effect": "Allow",
-                        "Action": [
-                            "s3:GetObjectVersion",
-                            "s3:GetObjectVersionAcl"
-                        ],
-                        "Resource": [
-                            f"arn:aws:s3:::{source_bucket}/*"
-                        ]
-                    },
-                    {
-                        "Effect": "Allow",
-                        "Action": [
-                            "s3:ReplicateObject",
-                            "s3:ReplicateDelete"
-                        ],
-                        "Resource": f"arn:aws:s3:::{destination_bucket}/*"
-                    }
-                ]
-            }
-            
-            # Attach policy to role
-            policy_name = f"s3-replication-policy-{uuid.uuid4().hex[:8]}"
-            policy_response = iam_client.create_policy(
-                PolicyName=policy_name,
-                PolicyDocument=json.dumps(policy_document)
-            )
-            
-            policy_arn = policy_response['Policy']['Arn']
+            # Validate the buckets first: the region lookup and the versioning
+            # changes (required for replication) fail on a missing or
+            # inaccessible bucket, and run concurrently before any IAM
+            # resource exists
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                def enable_versioning(bucket_name, region):
+                    return executor.submit(
+                        self._get_client('s3', region=region).put_bucket_versioning,
+                        Bucket=bucket_name,
+                        VersioningConfiguration={'Status': 'Enabled'}
+                    )
+                
+                region_future = executor.submit(self._bucket_region, source_bucket)
+                versioning_futures = [enable_versioning(source_bucket, None)]
+                if destination_region:
+                    versioning_futures.append(enable_versioning(destination_bucket, destination_region))
+                
+                source_region = region_future.result()
+                
+                # Determine destination region
+                if not destination_region:
+                    if replication_type == "CRR":
+                        # For CRR, use a different region than source
+                        destination_region = 'us-west-2' if source_region != 'us-west-2' else 'us-east-1'
+                    else:
+                        # For SRR, use the same region as source
+                        destination_region = source_region
+                    versioning_futures.append(enable_versioning(destination_bucket, destination_region))
+                
+                for future in versioning_futures:
+                    future.result()
             
-            iam_client.attach_role_policy(
-                RoleName=role_name,
-                PolicyArn=policy_arn
-            )
+            # The role and the permissions policy do not depend on each other,
+            # so create them concurrently and only join before attaching
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                role_future = executor.submit(
+                    iam_client.create_role,
+                    RoleName=role_name,
+                    AssumeRolePolicyDocument=_TRUST_POLICY_JSON
+                )
+                policy_future = executor.submit(
+                    iam_client.create_policy,
+                    PolicyName=policy_name,
+                    PolicyDocument=_REPLICATION_POLICY_TEMPLATE % (source_bucket, source_bucket, destination_bucket)
+                )
             
-            # Create replication configuration
-            replication_config = {
-                'Role': role_arn,
-                'Rules': [
-                    {
-                        'ID': f"{replication_type}-{uuid.uuid4().hex[:8]}",
-                        'Status': 'Enabled',
-                        'Destination': {
-                            'Bucket': f"arn:aws:s3:::{destination_bucket}"
+            # From here on, a failure removes whichever IAM resources were created
+            role_error, policy_error = role_future.exception(), policy_future.exception()
+            role_arn = None if role_error else role_future.result()['Role']['Arn']
+            policy_arn = None if policy_error else policy_future.result()['Policy']['Arn']
+            attached = False
+            try:
+                if role_error or policy_error:
+                    raise role_error or policy_error
+                
+                # Attach policy to role
+                iam_client.attach_role_policy(
+                    RoleName=role_name,
+                    PolicyArn=policy_arn
+                )
+                attached = True
+                
+                # Create replication configuration
+                replication_config = {
+                    'Role': role_arn,
+                    'Rules': [
+                        {
+                            'ID': f"{replication_type}-{_rand_tag()}",
+                            'Status': 'Enabled',
+                            'Destination': {
+                                'Bucket': f"arn:aws:s3:::{destination_bucket}"
+                            }
                         }
-                    }
-                ]
-            }
-            
-            # Add prefix filter if specified
-            if prefix:
-                replication_config['Rules'][0]['Filter'] = {
-                    'Prefix': prefix
+                    ]
                 }
+                
+                # Add prefix filter if specified
+                if prefix:
+                    replication_config['Rules'][0]['Filter'] = {
+                        'Prefix': prefix
+                    }
+                
+                # Wait for the IAM role to exist, then apply the replication
+                # configuration, retrying while S3 cannot assume the role yet
+                iam_client.get_waiter('role_exists').wait(
+                    RoleName=role_name,
+                    WaiterConfig={'Delay': 1, 'MaxAttempts': 10}
+                )
+                self._put_bucket_replication_when_role_ready(s3_client, source_bucket, replication_config)
+            except Exception:
+                self._delete_replication_iam(iam_client, role_name if role_arn else None, policy_arn, attached)
+                raise
             
-            # Wait for IAM role to propagate
-            import time
-            time.sleep(10)
-            
-            # Apply replication configuration
-            s3_client.put_bucket_replication(
-                Bucket=source_bucket,
-                ReplicationConfiguration=replication_config
+            self._invalidate(
+                ('get_bucket_replication', source_bucket),
+                ('get_bucket_versioning', source_bucket),
+                ('get_bucket_versioning', destination_bucket)
             )
             
             return {
@@ -311,28 +799,74 @@ class S3Service(BaseService):
                 }
             }
             
-        except ClientError as e:
-            logger.error(f"Error creating {replication_type} replication for bucket {source_bucket}: {e}")
+        except (ClientError, WaiterError) as e:
+            logger.error("Error creating %s replication for bucket %s: %s", replication_type, source_bucket, e)
             return {"status": "error", "message": str(e)}
     
+    def _delete_replication_iam(self, iam_client, role_name, policy_arn, attached):
+        """
+        Remove the IAM role and policy of a replication setup that failed part way
+        
+        role_name and policy_arn are None for resources that were never created.
+        Cleanup errors are logged rather than raised, so the caller can still
+        report the original failure.
+        """
+        try:
+            if attached:
+                iam_client.detach_role_policy(RoleName=role_name, PolicyArn=policy_arn)
+            if policy_arn:
+                iam_client.delete_policy(PolicyArn=policy_arn)
+            if role_name:
+                iam_client.delete_role(RoleName=role_name)
+        except ClientError as e:
+            logger.error("Error cleaning up replication role %s / policy %s: %s", role_name, policy_arn, e)
+    
+    def _put_bucket_replication_when_role_ready(self, s3_client, bucket_name, replication_config):
+        """
+        Apply a replication configuration whose IAM role was just created
+        
+        IAM is eventually consistent, so S3 may reject a brand new role for a few
+        seconds. Rather than sleeping for a fixed worst case, retry with
+        exponential backoff until the call succeeds or the deadline passes. The
+        last sleep is cut short so that one final attempt lands on the deadline.
+        """
+        deadline = time.monotonic() + _ROLE_PROPAGATION_TIMEOUT
+        backoff = 0.5
+        while True:
+            try:
+                return s3_client.put_bucket_replication(
+                    Bucket=bucket_name,
+                    ReplicationConfiguration=replication_config
+                )
+            except ClientError as e:
+                remaining = deadline - time.monotonic()
+                if not _role_not_ready(e.response['Error']) or remaining <= 0:
+                    raise
+                time.sleep(min(backoff, remaining))
+                backoff = min(backoff * 2, 8)
+    
     def delete_replication(self, bucket_name):
         """Delete replication configuration from an S3 bucket"""
         try:
             s3_client = self._get_client('s3')
             s3_client.delete_bucket_replication(Bucket=bucket_name)
+            self._invalidate(('get_bucket_replication', bucket_name))
             return {"status": "success", "message": f"Replication configuration deleted from bucket {bucket_name}"}
         except ClientError as e:
-            logger.error(f"Error deleting replication configuration for bucket {bucket_name}: {e}")
+            logger.error("Error deleting replication configuration for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     def get_bucket_versioning(self, bucket_name):
         """Get versioning status for an S3 bucket"""
-        try:
+        def fetch():
             s3_client = self._get_client('s3')
             response = s3_client.get_bucket_versioning(Bucket=bucket_name)
             status = response.get('Status', 'NotEnabled')
             return {"status": "success", "versioning": status}
+        
+        try:
+            return self._cached(('get_bucket_versioning', bucket_name), _VERSIONING_TTL, fetch)
         except ClientError as e:
-            logger.error(f"Error getting versioning for bucket {bucket_name}: {e}")
+            logger.error("Error getting versioning for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     def put_bucket_lifecycle_configuration(self, bucket_name, lifecycle_rules):
         """
@@ -367,25 +901,32 @@ class S3Service(BaseService):
                 Bucket=bucket_name,
                 LifecycleConfiguration=lifecycle_config
             )
+            self._invalidate(('get_bucket_lifecycle_configuration', bucket_name))
             
             return {
                 "status": "success",
                 "message": f"Lifecycle configuration applied to bucket {bucket_name} successfully"
             }
         except ClientError as e:
-            logger.error(f"Error setting lifecycle configuration for bucket {bucket_name}: {e}")
+            logger.error("Error setting lifecycle configuration for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     
     def get_bucket_lifecycle_configuration(self, bucket_name):
         """Get lifecycle configuration for an S3 bucket"""
-        try:
+        def fetch():
             s3_client = self._get_client('s3')
-            response = s3_client.get_bucket_lifecycle_configuration(Bucket=bucket_name)
+            try:
+                response = s3_client.get_bucket_lifecycle_configuration(Bucket=bucket_name)
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'NoSuchLifecycleConfiguration':
+                    return {"status": "success", "lifecycle_configuration": [], "message": "No lifecycle configuration exists for this bucket"}
+                raise
             return {"status": "success", "lifecycle_configuration": response.get('Rules', [])}
+        
+        try:
+            return self._cached(('get_bucket_lifecycle_configuration', bucket_name), _LIFECYCLE_TTL, fetch)
         except ClientError as e:
-            if e.response['Error']['Code'] == 'NoSuchLifecycleConfiguration':
-                return {"status": "success", "lifecycle_configuration": [], "message": "No lifecycle configuration exists for this bucket"}
-            logger.error(f"Error getting lifecycle configuration for bucket {bucket_name}: {e}")
+            logger.error("Error getting lifecycle configuration for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     
     def delete_bucket_lifecycle_configuration(self, bucket_name):
@@ -393,9 +934,10 @@ class S3Service(BaseService):
         try:
             s3_client = self._get_client('s3')
             s3_client.delete_bucket_lifecycle(Bucket=bucket_name)
+            self._invalidate(('get_bucket_lifecycle_configuration', bucket_name))
             return {"status": "success", "message": f"Lifecycle configuration deleted from bucket {bucket_name}"}
         except ClientError as e:
-            logger.error(f"Error deleting lifecycle configuration for bucket {bucket_name}: {e}")
+            logger.error("Error deleting lifecycle configuration for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     
     def put_bucket_policy(self, bucket_name, policy):
@@ -422,19 +964,20 @@ class S3Service(BaseService):
             s3_client = self._get_client('s3')
             
             # Convert policy dict to JSON string
-            policy_str = json.dumps(policy)
+            policy_str = _json_dumps(policy)
             
             s3_client.put_bucket_policy(
                 Bucket=bucket_name,
                 Policy=policy_str
             )
+            self._invalidate(('get_bucket_policy', bucket_name))
             
             return {
                 "status": "success",
                 "message": f"Policy applied to bucket {bucket_name} successfully"
             }
         except ClientError as e:
-            logger.error(f"Error setting policy for bucket {bucket_name}: {e}")
+            logger.error("Error setting policy for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     
     def delete_bucket_policy(self, bucket_name):
@@ -442,9 +985,10 @@ class S3Service(BaseService):
         try:
             s3_client = self._get_client('s3')
             s3_client.delete_bucket_policy(Bucket=bucket_name)
+            self._invalidate(('get_bucket_policy', bucket_name))
             return {"status": "success", "message": f"Policy deleted from bucket {bucket_name}"}
         except ClientError as e:
-            logger.error(f"Error deleting policy for bucket {bucket_name}: {e}")
+            logger.error("Error deleting policy for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     
     def put_public_access_block(self, bucket_name, block_public_acls=True, ignore_public_acls=True, 
@@ -487,28 +1031,35 @@ class S3Service(BaseService):
                     'RestrictPublicBuckets': restrict_public_buckets
                 }
             )
+            self._invalidate(('get_public_access_block', bucket_name))
             
             return {
                 "status": "success",
                 "message": f"Public access block settings applied to bucket {bucket_name} successfully"
             }
         except ClientError as e:
-            logger.error(f"Error setting public access block for bucket {bucket_name}: {e}")
+            logger.error("Error setting public access block for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     
     def get_public_access_block(self, bucket_name):
         """Get block public access settings for an S3 bucket"""
-        try:
+        def fetch():
             s3_client = self._get_client('s3')
-            response = s3_client.get_public_access_block(Bucket=bucket_name)
+            try:
+                response = s3_client.get_public_access_block(Bucket=bucket_name)
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'NoSuchPublicAccessBlockConfiguration':
+                    return {"status": "success", "public_access_block": None, "message": "No public access block configuration exists for this bucket"}
+                raise
             return {
                 "status": "success", 
                 "public_access_block": response.get('PublicAccessBlockConfiguration', {})
             }
+        
+        try:
+            return self._cached(('get_public_access_block', bucket_name), _PUBLIC_ACCESS_BLOCK_TTL, fetch)
         except ClientError as e:
-            if e.response['Error']['Code'] == 'NoSuchPublicAccessBlockConfiguration':
-                return {"status": "success", "public_access_block": None, "message": "No public access block configuration exists for this bucket"}
-            logger.error(f"Error getting public access block for bucket {bucket_name}: {e}")
+            logger.error("Error getting public access block for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     
     def delete_public_access_block(self, bucket_name):
@@ -516,9 +1067,10 @@ class S3Service(BaseService):
         try:
             s3_client = self._get_client('s3')
             s3_client.delete_public_access_block(Bucket=bucket_name)
+            self._invalidate(('get_public_access_block', bucket_name))
             return {"status": "success", "message": f"Public access block settings deleted from bucket {bucket_name}"}
         except ClientError as e:
-            logger.error(f"Error deleting public access block for bucket {bucket_name}: {e}")
+            logger.error("Error deleting public access block for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
             
     def get_object(self, bucket_name, object_key):
@@ -532,41 +1084,29 @@ class S3Service(BaseService):
         try:
             s3_client = self._get_client('s3')
             response = s3_client.get_object(Bucket=bucket_name, Key=object_key)
+            body = response['Body']
             
-            # Read the object content
-            content = response['Body'].read()
+            if not _fits_inline(response):
+                # Never displayed, so don't download or decode it
+                body.close()
+                return _object_result(response, None)
+            if _is_binary_content_type(response.get('ContentType')):
+                body.close()
+                return _object_result(response, _TextBodyReader(is_text=False))
             
-            # Try to decode as text if possible
+            reader = _TextBodyReader()
             try:
-                content_str = content.decode('utf-8')
-                is_text = True
-            except UnicodeDecodeError:
-                content_str = None
-                is_text = False
-            
-            result = {
-                "status": "success",
-                "metadata": {
-                    "content_type": response.get('ContentType'),
-                    "content_length": response.get('ContentLength'),
-                    "last_modified": response.get('LastModified').isoformat() if response.get('LastModified') else None,
-                    "etag": response.get('ETag'),
-                    "is_text": is_text
-                }
-            }
-            
-            # Include content if it's text and not too large
-            if is_text and len(content_str) < 1024 * 1024:  # Limit to 1MB
-                result["content"] = content_str
-            elif is_text:
-                result["message"] = "Content too large to display (> 1MB). Use a more specific operation to download."
-            else:
-                result["message"] = "Binary content. Use a more specific operation to download."
-                
-            return result
+                for chunk in body.iter_chunks(chunk_size=_GET_OBJECT_CHUNK_SIZE):
+                    if not reader.feed(chunk):
+                        break
+                else:
+                    reader.finish()
+            finally:
+                body.close()
+            return _object_result(response, reader)
             
         except ClientError as e:
-            logger.error(f"Error getting object {object_key} from bucket {bucket_name}: {e}")
+            logger.error("Error getting object %s from bucket %s: %s", object_key, bucket_name, e)
             return {"status": "error", "message": str(e)}
     
     def put_object(self, bucket_name, object_key, content, content_type=None):
@@ -576,7 +1116,7 @@ class S3Service(BaseService):
         Args:
             bucket_name (str): Name of the S3 bucket
             object_key (str): Key for the object
-            content (str): Content to upload
+            content (str or bytes): Content to upload
             content_type (str): Content type of the object (optional)
         """
         # Request confirmation before uploading object
@@ -596,26 +1136,41 @@ class S3Service(BaseService):
         try:
             s3_client = self._get_client('s3')
             
-            # Prepare parameters
-            params = {
-                'Bucket': bucket_name,
-                'Key': object_key,
-                'Body': content
-            }
+            # A str is never shorter in UTF-8 than in characters, so only bodies
+            # that may cross the multipart threshold need encoding up front
+            if isinstance(content, str) and len(content) > _MULTIPART_THRESHOLD:
+                content = content.encode('utf-8')
             
-            # Add content type if provided
-            if content_type:
-                params['ContentType'] = content_type
+            if isinstance(content, (bytes, bytearray)) and len(content) > _MULTIPART_THRESHOLD:
+                # Upload large bodies as parts over several connections
+                s3_client.upload_fileobj(
+                    io.BytesIO(content),
+                    bucket_name,
+                    object_key,
+                    ExtraArgs={'ContentType': content_type} if content_type else None,
+                    Config=_TRANSFER_CONFIG
+                )
+            else:
+                # Prepare parameters
+                params = {
+                    'Bucket': bucket_name,
+                    'Key': object_key,
+                    'Body': content
+                }
                 
-            # Upload the object
-            s3_client.put_object(**params)
+                # Add content type if provided
+                if content_type:
+                    params['ContentType'] = content_type
+                    
+                # Upload the object
+                s3_client.put_object(**params)
             
             return {
                 "status": "success",
                 "message": f"Object {object_key} uploaded to bucket {bucket_name} successfully"
             }
-        except ClientError as e:
-            logger.error(f"Error uploading object {object_key} to bucket {bucket_name}: {e}")
+        except (ClientError, S3UploadFailedError) as e:
+            logger.error("Error uploading object %s to bucket %s: %s", object_key, bucket_name, e)
             return {"status": "error", "message": str(e)}
     
     def delete_object(self, bucket_name, object_key):
@@ -634,9 +1189,102 @@ class S3Service(BaseService):
                 "message": f"Object {object_key} deleted from bucket {bucket_name} successfully"
             }
         except ClientError as e:
-            logger.error(f"Error deleting object {object_key} from bucket {bucket_name}: {e}")
+            logger.error("Error deleting object %s from bucket %s: %s", object_key, bucket_name, e)
             return {"status": "error", "message": str(e)}
     
+    def delete_objects(self, bucket_name, object_keys):
+        """
+        Delete many objects from an S3 bucket
+        
+        Keys are sent in batches of up to 1000 per DeleteObjects request rather
+        than one DELETE request per object.
+        
+        Args:
+            bucket_name (str): Name of the S3 bucket
+            object_keys (list): Keys of the objects to delete
+        """
+        deleted_count = 0
+        errors = []
+        try:
+            s3_client = self._get_client('s3')
+            keys = iter(object_keys)
+            while True:
+                batch = [{'Key': key} for key in itertools.islice(keys, 1000)]
+                if not batch:
+                    break
+                batch_errors = self._delete_batch(s3_client, bucket_name, batch)
+                deleted_count += len(batch) - len(batch_errors)
+                errors.extend(batch_errors)
+        except ClientError as e:
+            logger.error("Error deleting objects from bucket %s: %s", bucket_name, e)
+            return {"status": "error", "message": str(e), "deleted_count": deleted_count, "errors": errors}
+        
+        return _deletion_result(bucket_name, deleted_count, errors)
+    
+    def empty_bucket(self, bucket_name, max_workers=16, confirmed=False):
+        """
+        Delete every object in an S3 bucket, including all versions and delete markers
+        
+        Listing object versions covers both versioned and unversioned buckets.
+        Each listing page (at most 1000 entries) becomes one DeleteObjects batch,
+        and batches are deleted concurrently while the listing continues.
+        
+        Args:
+            bucket_name (str): Name of the S3 bucket
+            max_workers (int): Maximum number of concurrent delete requests
+            confirmed (bool): Whether the user already confirmed the deletion
+        """
+        # The deletion cannot be undone, so request confirmation before listing anything
+        if not confirmed:
+            confirmation = self._request_confirmation(
+                operation_type="delete",
+                resource_type="every object version and delete marker in the S3 bucket",
+                params={"bucket_name": bucket_name}
+            )
+            
+            if confirmation:
+                return confirmation
+        
+        deleted_count = 0
+        errors = []
+        try:
+            s3_client = self._get_client('s3')
+            paginator = s3_client.get_paginator('list_object_versions')
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for page in paginator.paginate(Bucket=bucket_name):
+                    entries = itertools.chain(page.get('Versions', ()), page.get('DeleteMarkers', ()))
+                    batch = [{'Key': entry['Key'], 'VersionId': entry['VersionId']} for entry in entries]
+                    if batch:
+                        futures[executor.submit(self._delete_batch, s3_client, bucket_name, batch)] = len(batch)
+                
+                for future in as_completed(futures):
+                    batch_errors = future.result()
+                    deleted_count += futures[future] - len(batch_errors)
+                    errors.extend(batch_errors)
+        except ClientError as e:
+            logger.error("Error emptying bucket %s: %s", bucket_name, e)
+            return {"status": "error", "message": str(e), "deleted_count": deleted_count, "errors": errors}
+        
+        return _deletion_result(bucket_name, deleted_count, errors)
+    
+    def _delete_batch(self, s3_client, bucket_name, objects):
+        """
+        Delete up to 1000 objects with one quiet DeleteObjects request
+        
+        Returns the keys that could not be deleted; quiet mode does not report
+        the successful ones.
+        """
+        response = s3_client.delete_objects(
+            Bucket=bucket_name,
+            Delete={'Objects': objects, 'Quiet': True}
+        )
+        return [{
+            "key": error.get('Key'),
+            "code": error.get('Code'),
+            "message": error.get('Message')
+        } for error in response.get('Errors', [])]
+    
     def put_bucket_website(self, bucket_name, index_document, error_document=None, redirect_all_requests_to=None):
         """
         Configure static website hosting for an S3 bucket
@@ -684,7 +1332,7 @@ class S3Service(BaseService):
             )
             
             # Get the website endpoint
-            region = self.get_bucket_location(bucket_name).get('location')
+            region = self._bucket_region(bucket_name)
             if region == 'us-east-1':
                 website_endpoint = f"http://{bucket_name}.s3-website-{region}.amazonaws.com"
             else:
@@ -696,7 +1344,7 @@ class S3Service(BaseService):
                 "website_endpoint": website_endpoint
             }
         except ClientError as e:
-            logger.error(f"Error setting website configuration for bucket {bucket_name}: {e}")
+            logger.error("Error setting website configuration for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     
     def get_bucket_website(self, bucket_name):
@@ -713,17 +1361,26 @@ class S3Service(BaseService):
         except ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchWebsiteConfiguration':
                 return {"status": "success", "website_configuration": None, "message": "No website configuration exists for this bucket"}
-            logger.error(f"Error getting website configuration for bucket {bucket_name}: {e}")
+            logger.error("Error getting website configuration for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     
     def delete_bucket_website(self, bucket_name):
         """Delete website configuration from an S3 bucket"""
         try:
-            s3_client = self._get_client('s3')
+            s3_client = self._get_client('s3', fail_fast=True)
+            # Skip the delete when there is nothing to delete. Any other read
+            # failure (e.g. no s3:GetBucketWebsite permission) falls through to
+            # the delete.
+            try:
+                s3_client.get_bucket_website(Bucket=bucket_name)
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'NoSuchWebsiteConfiguration':
+                    return {"status": "success", "message": f"No website configuration exists for bucket {bucket_name}", "unchanged": True}
+                logger.debug("Could not read website configuration of bucket %s before deleting it: %s", bucket_name, e)
             s3_client.delete_bucket_website(Bucket=bucket_name)
             return {"status": "success", "message": f"Website configuration deleted from bucket {bucket_name}"}
         except ClientError as e:
-            logger.error(f"Error deleting website configuration for bucket {bucket_name}: {e}")
+            logger.error("Error deleting website configuration for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
     
     def put_bucket_acl(self, bucket_name, acl='private'):
@@ -748,7 +1405,23 @@ class S3Service(BaseService):
             return confirmation
             
         try:
-            s3_client = self._get_client('s3')
+            s3_client = self._get_client('s3', fail_fast=True)
+            
+            # A GET is cheaper than a PUT, so skip the write when the bucket
+            # already carries the requested canned ACL. Callers may be allowed
+            # to write the ACL but not read it, so a failed read falls through
+            # to the write.
+            try:
+                current_acl = _canned_acl(s3_client.get_bucket_acl(Bucket=bucket_name))
+            except ClientError as e:
+                logger.debug("Could not read ACL of bucket %s before writing it: %s", bucket_name, e)
+                current_acl = None
+            if current_acl == acl:
+                return {
+                    "status": "success",
+                    "message": f"Bucket {bucket_name} already has ACL '{acl}'",
+                    "unchanged": True
+                }
             
             s3_client.put_bucket_acl(
                 Bucket=bucket_name,
@@ -760,5 +1433,5 @@ class S3Service(BaseService):
                 "message": f"ACL '{acl}' applied to bucket {bucket_name} successfully"
             }
         except ClientError as e:
-            logger.error(f"Error setting ACL for bucket {bucket_name}: {e}")
+            logger.error("Error setting ACL for bucket %s: %s", bucket_name, e)
             return {"status": "error", "message": str(e)}
@@ -5,6 +5,14 @@ from .base import BaseService
 
 logger = logging.getLogger('aws-storage-mcp')
 
+def _access_point_rows(access_points):
+    """Convert ListAccessPointsForObjectLambda entries into a list of row dicts"""
+    return [{
+        "name": ap['Name'],
+        "arn": ap['ObjectLambdaAccessPointArn'],
+        "alias": ap.get('Alias', '')
+    } for ap in access_points]
+
 class S3ObjectLambdaService(BaseService):
     """Handler for Amazon S3 Object Lambda operations"""
     
@@ -12,16 +20,12 @@ class S3ObjectLambdaService(BaseService):
         """List all S3 Object Lambda Access Points"""
         try:
             s3control_client = self._get_client('s3control')
-            sts_client = self._get_client('sts')
-            account_id = sts_client.get_caller_identity().get('Account')
+            account_id = self._get_account_id()
             
-            response = s3control_client.list_access_points_for_object_lambda(AccountId=account_id)
+            paginator = s3control_client.get_paginator('list_access_points_for_object_lambda')
+            pages = paginator.paginate(AccountId=account_id)
             
-            access_points = [{
-                "name": ap['Name'],
-                "arn": ap['ObjectLambdaAccessPointArn'],
-                "alias": ap.get('Alias', '')
-            } for ap in response.get('ObjectLambdaAccessPoints', [])]
+            access_points = [row for page in pages for row in _access_point_rows(page.get('ObjectLambdaAccessPoints', []))]
             
             return {"status": "success", "object_lambda_access_points": access_points}
         except ClientError as e:
@@ -1,69 +1,121 @@
 #!/usr/bin/env python3
 import logging
+import operator
 from botocore.exceptions import ClientError
 from .base import BaseService
 
 logger = logging.getLogger('aws-storage-mcp')
 
+# Seconds that list_jobs and list_clusters results are reused
+_LIST_TTL = 30
+
+_job_fields = operator.itemgetter('JobId', 'JobState', 'JobType', 'CreationDate')
+
+# (response key, result key, default) for the optional DescribeJob metadata fields
+_JOB_DETAIL_FIELDS = (
+    ('Description', 'description', ''),
+    ('SnowballType', 'snowball_type', ''),
+    ('ShippingOption', 'shipping_option', ''),
+    ('SnowballCapacityPreference', 'snowball_capacity', ''),
+    ('AddressId', 'address_id', ''),
+    ('KmsKeyARN', 'kms_key_arn', ''),
+)
+
+def _job_rows(jobs):
+    """Convert ListJobs entries into a list of row dicts"""
+    return [{
+        "id": job['JobId'],
+        "state": job['JobState'],
+        "type": job['JobType'],
+        "creation_date": job['CreationDate'].isoformat(),
+        "description": job.get('Description', ''),
+        "snowball_type": job.get('SnowballType', '')
+    } for job in jobs]
+
+def _cluster_rows(clusters):
+    """Convert ListClusters entries into a list of row dicts"""
+    return [{
+        "id": cluster['ClusterId'],
+        "state": cluster['ClusterState'],
+        "creation_date": cluster['CreationDate'].isoformat(),
+        "description": cluster.get('Description', '')
+    } for cluster in clusters]
+
 class SnowService(BaseService):
     """Handler for AWS Snow Family operations"""
     
     def list_jobs(self):
         """List all Snow Family jobs"""
-        try:
-            snow_client = self._get_client('snowball')
-            response = snow_client.list_jobs()
-            jobs = [{
-                "id": job['JobId'],
-                "state": job['JobState'],
-                "type": job['JobType'],
-                "creation_date": job['CreationDate'].isoformat(),
-                "description": job.get('Description', ''),
-                "snowball_type": job.get('SnowballType', '')
-            } for job in response['JobListEntries']]
+        def fetch():
+            jobs = [row for page in self.iter_jobs() for row in page]
             return {"status": "success", "jobs": jobs}
+        
+        try:
+            return self._cached(('list_jobs',), _LIST_TTL, fetch)
         except ClientError as e:
             logger.error(f"Error listing Snow Family jobs: {e}")
             return {"status": "error", "message": str(e)}
     
+    def iter_jobs(self):
+        """Yield Snow job rows one ListJobs page at a time"""
+        snow_client = self._get_client('snowball')
+        pages = snow_client.get_paginator('list_jobs').paginate(PaginationConfig={'PageSize': 100})
+        for page in pages:
+            yield _job_rows(page['JobListEntries'])
+    
     def describe_job(self, job_id):
         """Get detailed information about a Snow Family job"""
         try:
             snow_client = self._get_client('snowball')
             response = snow_client.describe_job(JobId=job_id)
             
+            metadata = response['JobMetadata']
+            metadata_job_id, state, job_type, creation_date = _job_fields(metadata)
             job_info = {
-                "id": response['JobMetadata']['JobId'],
-                "state": response['JobMetadata']['JobState'],
-                "type": response['JobMetadata']['JobType'],
-                "creation_date": response['JobMetadata']['CreationDate'].isoformat(),
-                "description": response['JobMetadata'].get('Description', ''),
-                "snowball_type": response['JobMetadata'].get('SnowballType', ''),
-                "shipping_option": response['JobMetadata'].get('ShippingOption', ''),
-                "snowball_capacity": response['JobMetadata'].get('SnowballCapacityPreference', ''),
-                "address_id": response['JobMetadata'].get('AddressId', ''),
-                "kms_key_arn": response['JobMetadata'].get('KmsKeyARN', '')
+                "id": metadata_job_id,
+                "state": state,
+                "type": job_type,
+                "creation_date": creation_date.isoformat()
             }
+            job_info.update((key, metadata.get(field, default)) for field, key, default in _JOB_DETAIL_FIELDS)
             
             return {"status": "success", "job": job_info}
         except ClientError as e:
             logger.error(f"Error describing Snow Family job {job_id}: {e}")
             return {"status": "error", "message": str(e)}
     
+    def describe_jobs(self, job_ids=None, max_workers=20):
+        """
+        Get detailed information about many Snow Family jobs concurrently
+        
+        Args:
+            job_ids (list): Job IDs to describe (all jobs if omitted)
+            max_workers (int): Maximum number of concurrent requests
+        """
+        if job_ids is None:
+            listing = self.list_jobs()
+            if listing['status'] != 'success':
+                return listing
+            job_ids = [job['id'] for job in listing['jobs']]
+        
+        jobs, errors = self._parallel_describe(job_ids, self.describe_job, 'job', max_workers)
+        result = {"status": "success", "jobs": jobs}
+        if errors:
+            result["errors"] = errors
+        return result
+    
     def list_clusters(self):
         """List all Snow Family clusters"""
-        try:
+        def fetch():
             snow_client = self._get_client('snowball')
-            response = snow_client.list_clusters()
+            pages = snow_client.get_paginator('list_clusters').paginate(PaginationConfig={'PageSize': 100})
             
-            clusters = [{
-                "id": cluster['ClusterId'],
-                "state": cluster['ClusterState'],
-                "creation_date": cluster['CreationDate'].isoformat(),
-                "description": cluster.get('Description', '')
-            } for cluster in response['ClusterListEntries']]
+            clusters = [row for page in pages for row in _cluster_rows(page['ClusterListEntries'])]
             
             return {"status": "success", "clusters": clusters}
+        
+        try:
+            return self._cached(('list_clusters',), _LIST_TTL, fetch)
         except ClientError as e:
             logger.error(f"Error listing Snow Family clusters: {e}")
             return {"status": "error", "message": str(e)}
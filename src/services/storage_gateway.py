@@ -1,100 +1,211 @@
 #!/usr/bin/env python3
 import json
 import logging
-from botocore.exceptions import ClientError
+import operator
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from botocore.exceptions import BotoCoreError, ClientError
 from .base import BaseService
 
 logger = logging.getLogger('aws-storage-mcp')
 
+# Seconds that gateway, volume and file share listings are reused
+_LIST_TTL = 30
+
+_gateway_detail_fields = operator.itemgetter('GatewayARN', 'GatewayName', 'GatewayType')
+
+# (response key, result key, default) for the optional DescribeGatewayInformation fields
+_GATEWAY_DETAIL_FIELDS = (
+    ('GatewayOperationalState', 'status', ''),
+    ('GatewayNetworkInterfaces', 'network_interfaces', ()),
+    ('GatewayTimezone', 'timezone', ''),
+    ('Ec2InstanceId', 'ec2_instance_id', ''),
+    ('GatewayEndpoint', 'endpoint_type', ''),
+    ('HostEnvironment', 'host_environment', ''),
+    ('GatewaySoftwareVersion', 'software_version', ''),
+)
+
+def _gateway_rows(gateways):
+    """Convert ListGateways entries into a list of row dicts"""
+    return [{
+        "id": gw['GatewayId'],
+        "arn": gw['GatewayARN'],
+        "name": gw['GatewayName'],
+        "type": gw['GatewayType'],
+        "status": gw['GatewayOperationalState'],
+        "ec2_instance_id": gw.get('Ec2InstanceId', ''),
+        "endpoint_type": gw.get('GatewayEndpoint', '')
+    } for gw in gateways]
+
+def _volume_rows(volumes):
+    """Convert ListVolumes entries into a list of row dicts"""
+    return [{
+        "id": vol['VolumeARN'],
+        "type": vol['VolumeType'],
+        "size_in_bytes": vol['VolumeSizeInBytes'],
+        "gateway_id": vol['GatewayARN'],
+        "target_name": vol.get('TargetName', '')
+    } for vol in volumes]
+
+def _file_share_rows(file_shares):
+    """Convert ListFileShares entries into a list of row dicts"""
+    return [{
+        "id": share['FileShareARN'],
+        "type": share['FileShareType'],
+        "gateway_id": share['GatewayARN'],
+        "path": share.get('Path', '')
+    } for share in file_shares]
+
+# Default role the gateway assumes to reach S3 when no role ARN is given
+_SG_ROLE_NAME = 'StorageGatewayS3Access'
+
+# Trust policy letting Storage Gateway assume that role; it never changes, so it is serialized once
+_SG_TRUST_POLICY_JSON = json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Principal": {"Service": "storagegateway.amazonaws.com"},
+            "Action": "sts:AssumeRole"
+        }
+    ]
+})
+
+# Profile name -> ARN of the default role. The role is looked up or created once
+# per profile; the lock stops concurrent requests from both trying to create it.
+_sg_role_arns = {}
+_sg_role_lock = threading.Lock()
+
 class StorageGatewayService(BaseService):
     """Handler for AWS Storage Gateway operations"""
     
     def list_gateways(self):
         """List all Storage Gateways"""
-        try:
+        def fetch():
             sg_client = self._get_client('storagegateway')
-            response = sg_client.list_gateways()
-            gateways = [{
-                "id": gw['GatewayId'],
-                "name": gw['GatewayName'],
-                "type": gw['GatewayType'],
-                "status": gw['GatewayOperationalState'],
-                "ec2_instance_id": gw.get('Ec2InstanceId', ''),
-                "endpoint_type": gw.get('GatewayEndpoint', '')
-            } for gw in response['Gateways']]
+            pages = sg_client.get_paginator('list_gateways').paginate()
+            gateways = [row for page in pages for row in _gateway_rows(page['Gateways'])]
             return {"status": "success", "gateways": gateways}
+        
+        try:
+            return self._cached(('list_gateways',), _LIST_TTL, fetch)
         except ClientError as e:
             logger.error(f"Error listing Storage Gateways: {e}")
             return {"status": "error", "message": str(e)}
     
     def list_volumes(self, gateway_id=None):
         """List Storage Gateway volumes, optionally filtered by gateway ID"""
-        try:
-            sg_client = self._get_client('storagegateway')
-            
-            if gateway_id:
-                response = sg_client.list_volumes(GatewayARN=gateway_id)
-            else:
-                response = sg_client.list_volumes()
-                
-            volumes = [{
-                "id": vol['VolumeARN'],
-                "type": vol['VolumeType'],
-                "size_in_bytes": vol['VolumeSizeInBytes'],
-                "gateway_id": vol['GatewayARN'],
-                "target_name": vol.get('TargetName', '')
-            } for vol in response.get('VolumeInfos', [])]
-            
+        def fetch():
+            volumes = [row for page in self.iter_volumes(gateway_id) for row in page]
             return {"status": "success", "volumes": volumes}
+        
+        try:
+            return self._cached(('list_volumes', gateway_id), _LIST_TTL, fetch)
         except ClientError as e:
             logger.error(f"Error listing Storage Gateway volumes: {e}")
             return {"status": "error", "message": str(e)}
     
+    def iter_volumes(self, gateway_id=None):
+        """Yield volume rows one page at a time, optionally for a single gateway"""
+        sg_client = self._get_client('storagegateway')
+        paginator = sg_client.get_paginator('list_volumes')
+        pages = paginator.paginate(GatewayARN=gateway_id) if gateway_id else paginator.paginate()
+        for page in pages:
+            yield _volume_rows(page.get('VolumeInfos', []))
+    
     def describe_gateway(self, gateway_id):
         """Get detailed information about a Storage Gateway"""
         try:
             sg_client = self._get_client('storagegateway')
             response = sg_client.describe_gateway_information(GatewayARN=gateway_id)
             
-            gateway_info = {
-                "id": response['GatewayARN'],
-                "name": response['GatewayName'],
-                "type": response['GatewayType'],
-                "status": response.get('GatewayOperationalState', ''),
-                "network_interfaces": response.get('GatewayNetworkInterfaces', []),
-                "timezone": response.get('GatewayTimezone', ''),
-                "ec2_instance_id": response.get('Ec2InstanceId', ''),
-                "endpoint_type": response.get('GatewayEndpoint', ''),
-                "host_environment": response.get('HostEnvironment', ''),
-                "software_version": response.get('GatewaySoftwareVersion', '')
-            }
+            gateway_arn, name, gateway_type = _gateway_detail_fields(response)
+            gateway_info = {"id": gateway_arn, "name": name, "type": gateway_type}
+            gateway_info.update((key, response.get(field, default)) for field, key, default in _GATEWAY_DETAIL_FIELDS)
             
             return {"status": "success", "gateway": gateway_info}
         except ClientError as e:
             logger.error(f"Error describing Storage Gateway {gateway_id}: {e}")
             return {"status": "error", "message": str(e)}
     
+    def describe_gateways(self, gateway_ids=None, max_workers=20):
+        """
+        Get detailed information about many Storage Gateways concurrently
+        
+        Args:
+            gateway_ids (list): Gateway ARNs to describe (all gateways if omitted)
+            max_workers (int): Maximum number of concurrent requests
+        """
+        if gateway_ids is None:
+            listing = self.list_gateways()
+            if listing['status'] != 'success':
+                return listing
+            gateway_ids = [gw['arn'] for gw in listing['gateways']]
+        
+        gateways, errors = self._parallel_describe(gateway_ids, self.describe_gateway, 'gateway', max_workers)
+        result = {"status": "success", "gateways": gateways}
+        if errors:
+            result["errors"] = errors
+        return result
+    
     def list_file_shares(self, gateway_id=None):
         """List Storage Gateway file shares, optionally filtered by gateway ID"""
-        try:
-            sg_client = self._get_client('storagegateway')
-            
-            if gateway_id:
-                response = sg_client.list_file_shares(GatewayARN=gateway_id)
-            else:
-                response = sg_client.list_file_shares()
-                
-            file_shares = [{
-                "id": share['FileShareARN'],
-                "type": share['FileShareType'],
-                "gateway_id": share['GatewayARN'],
-                "path": share.get('Path', '')
-            } for share in response.get('FileShareInfoList', [])]
-            
+        def fetch():
+            file_shares = [row for page in self.iter_file_shares(gateway_id) for row in page]
             return {"status": "success", "file_shares": file_shares}
+        
+        try:
+            return self._cached(('list_file_shares', gateway_id), _LIST_TTL, fetch)
         except ClientError as e:
             logger.error(f"Error listing Storage Gateway file shares: {e}")
             return {"status": "error", "message": str(e)}
+    
+    def iter_file_shares(self, gateway_id=None):
+        """Yield file share rows one page at a time, optionally for a single gateway"""
+        sg_client = self._get_client('storagegateway')
+        paginator = sg_client.get_paginator('list_file_shares')
+        pages = paginator.paginate(GatewayARN=gateway_id) if gateway_id else paginator.paginate()
+        for page in pages:
+            yield _file_share_rows(page.get('FileShareInfoList', []))
+    
+    def _get_or_create_sg_role(self):
+        """
+        Return the ARN of the default Storage Gateway S3 access role
+        
+        The role is created, with AmazonS3FullAccess attached, if it does not
+        exist yet. The ARN is cached per profile, so only the first file share
+        created pays for the IAM calls.
+        """
+        role_arn = _sg_role_arns.get(self.profile_name)
+        if role_arn is not None:
+            return role_arn
+        
+        with _sg_role_lock:
+            role_arn = _sg_role_arns.get(self.profile_name)
+            if role_arn is not None:
+                return role_arn
+            
+            iam_client = self._get_client('iam')
+            try:
+                role_response = iam_client.get_role(RoleName=_SG_ROLE_NAME)
+            except ClientError:
+                # Create the role if it doesn't exist
+                role_response = iam_client.create_role(
+                    RoleName=_SG_ROLE_NAME,
+                    AssumeRolePolicyDocument=_SG_TRUST_POLICY_JSON,
+                    Description='Role for Storage Gateway to access S3'
+                )
+                
+                # Attach the AmazonS3FullAccess policy
+                iam_client.attach_role_policy(
+                    RoleName=_SG_ROLE_NAME,
+                    PolicyArn='arn:aws:iam::aws:policy/AmazonS3FullAccess'
+                )
+            
+            role_arn = _sg_role_arns[self.profile_name] = role_response['Role']['Arn']
+            return role_arn
+    
     def create_nfs_file_share(self, gateway_id, location_arn, client_token=None, role_arn=None, name=None):
         """
         Create an NFS file share on a Storage Gateway
@@ -123,47 +234,20 @@ class StorageGatewayService(BaseService):
         
         if confirmation:
             return confirmation
-            
+        
+        return self._create_nfs_file_share(gateway_id, location_arn, client_token, role_arn, name)
+    
+    def _create_nfs_file_share(self, gateway_id, location_arn, client_token=None, role_arn=None, name=None):
+        """Create an NFS file share without asking for confirmation (see create_nfs_file_share)"""
         try:
             sg_client = self._get_client('storagegateway')
             
             # If no client token provided, generate one
-            if not client_token:
-                import uuid
-                client_token = str(uuid.uuid4())
+            client_token = client_token or uuid.uuid4().hex
             
             # If no role ARN provided, use the default Storage Gateway role
             if not role_arn:
-                iam_client = self._get_client('iam')
-                try:
-                    role_response = iam_client.get_role(RoleName='StorageGatewayS3Access')
-                    role_arn = role_response['Role']['Arn']
-                except ClientError:
-                    # Create the role if it doesn't exist
-                    trust_policy = {
-                        "Version": "2012-10-17",
-                        "Statement": [
-                            {
-                                "Effect": "Allow",
-                                "Principal": {"Service": "storagegateway.amazonaws.com"},
-                                "Action": "sts:AssumeRole"
-                            }
-                        ]
-                    }
-                    
-                    role_response = iam_client.create_role(
-                        RoleName='StorageGatewayS3Access',
-                        AssumeRolePolicyDocument=json.dumps(trust_policy),
-                        Description='Role for Storage Gateway to access S3'
-                    )
-                    
-                    # Attach the AmazonS3FullAccess policy
-                    iam_client.attach_role_policy(
-                        RoleName='StorageGatewayS3Access',
-                        PolicyArn='arn:aws:iam::aws:policy/AmazonS3FullAccess'
-                    )
-                    
-                    role_arn = role_response['Role']['Arn']
+                role_arn = self._get_or_create_sg_role()
             
             # Create the NFS file share
             create_params = {
@@ -184,6 +268,7 @@ class StorageGatewayService(BaseService):
                 create_params['Tags'] = [{'Key': 'Name', 'Value': name}]
             
             response = sg_client.create_nfs_file_share(**create_params)
+            self._invalidate_all('list_file_shares')
             
             return {
                 "status": "success",
@@ -223,47 +308,20 @@ class StorageGatewayService(BaseService):
         
         if confirmation:
             return confirmation
-            
+        
+        return self._create_smb_file_share(gateway_id, location_arn, client_token, role_arn, name, password)
+    
+    def _create_smb_file_share(self, gateway_id, location_arn, client_token=None, role_arn=None, name=None, password=None):
+        """Create an SMB file share without asking for confirmation (see create_smb_file_share)"""
         try:
             sg_client = self._get_client('storagegateway')
             
             # If no client token provided, generate one
-            if not client_token:
-                import uuid
-                client_token = str(uuid.uuid4())
+            client_token = client_token or uuid.uuid4().hex
             
             # If no role ARN provided, use the default Storage Gateway role
             if not role_arn:
-                iam_client = self._get_client('iam')
-                try:
-                    role_response = iam_client.get_role(RoleName='StorageGatewayS3Access')
-                    role_arn = role_response['Role']['Arn']
-                except ClientError:
-                    # Create the role if it doesn't exist
-                    trust_policy = {
-                        "Version": "2012-10-17",
-                        "Statement": [
-                            {
-                                "Effect": "Allow",
-                                "Principal": {"Service": "storagegateway.amazonaws.com"},
-                                "Action": "sts:AssumeRole"
-                            }
-                        ]
-                    }
-                    
-                    role_response = iam_client.create_role(
-                        RoleName='StorageGatewayS3Access',
-                        AssumeRolePolicyDocument=json.dumps(trust_policy),
-                        Description='Role for Storage Gateway to access S3'
-                    )
-                    
-                    # Attach the AmazonS3FullAccess policy
-                    iam_client.attach_role_policy(
-                        RoleName='StorageGatewayS3Access',
-                        PolicyArn='arn:aws:iam::aws:policy/AmazonS3FullAccess'
-                    )
-                    
-                    role_arn = role_response['Role']['Arn']
+                role_arn = self._get_or_create_sg_role()
             
             # Create the SMB file share
             create_params = {
@@ -289,6 +347,7 @@ class StorageGatewayService(BaseService):
                 create_params['Tags'] = [{'Key': 'Name', 'Value': name}]
             
             response = sg_client.create_smb_file_share(**create_params)
+            self._invalidate_all('list_file_shares')
             
             return {
                 "status": "success",
@@ -299,11 +358,80 @@ class StorageGatewayService(BaseService):
             logger.error(f"Error creating SMB file share on gateway {gateway_id}: {e}")
             return {"status": "error", "message": str(e)}
     
+    def create_file_shares_bulk(self, specs, max_workers=16):
+        """
+        Create many NFS and/or SMB file shares concurrently
+        
+        Confirmation is requested once for the whole batch. Each share is then
+        created on a thread pool, and a failing share does not stop the others.
+        
+        Args:
+            specs (list): One dict per share with a "type" of "NFS" or "SMB" plus
+                          the keyword arguments of create_nfs_file_share or
+                          create_smb_file_share
+            max_workers (int): Maximum number of concurrent requests
+            
+        Returns a result per spec, in the same order.
+        """
+        if not isinstance(specs, list) or not all(isinstance(spec, dict) for spec in specs):
+            return {"status": "error", "message": "file_shares must be a list of file share objects"}
+        
+        confirmation = self._request_confirmation(
+            operation_type="create",
+            resource_type="Storage Gateway file shares",
+            params={
+                "count": len(specs),
+                # Never echo SMB passwords back in the confirmation prompt
+                "file_shares": [{k: v for k, v in spec.items() if k != 'password'} for spec in specs]
+            }
+        )
+        
+        if confirmation:
+            return confirmation
+        
+        def create(spec):
+            spec = dict(spec)
+            share_type = str(spec.pop('type', 'NFS')).upper()
+            # Confirmed as a batch, so the per-share calls must not ask again
+            create_share = {
+                'NFS': self._create_nfs_file_share,
+                'SMB': self._create_smb_file_share
+            }.get(share_type)
+            if create_share is None:
+                return {"status": "error", "message": f"Unsupported file share type: {share_type}"}
+            try:
+                return create_share(**spec)
+            except TypeError as e:
+                return {"status": "error", "message": f"Invalid file share parameters: {e}"}
+            except (ClientError, BotoCoreError) as e:
+                # e.g. ParamValidationError for a malformed ARN; keep it to this spec
+                logger.error(f"Error creating {share_type} file share: {e}")
+                return {"status": "error", "message": str(e)}
+        
+        results = []
+        if specs:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(specs))) as executor:
+                results = list(executor.map(create, specs))
+        
+        failed = sum(result['status'] != 'success' for result in results)
+        if failed:
+            return {
+                "status": "error",
+                "message": f"{failed} of {len(results)} file share(s) could not be created",
+                "results": results
+            }
+        return {
+            "status": "success",
+            "message": f"{len(results)} file share(s) created successfully",
+            "results": results
+        }
+    
     def delete_file_share(self, file_share_arn):
         """Delete a Storage Gateway file share"""
         try:
-            sg_client = self._get_client('storagegateway')
+            sg_client = self._get_client('storagegateway', fail_fast=True)
             sg_client.delete_file_share(FileShareARN=file_share_arn)
+            self._invalidate_all('list_file_shares')
             return {"status": "success", "message": f"File share {file_share_arn} deleted successfully"}
         except ClientError as e:
             logger.error(f"Error deleting file share {file_share_arn}: {e}")
@@ -337,7 +465,7 @@ class StorageGatewayService(BaseService):
             return confirmation
             
         try:
-            sg_client = self._get_client('storagegateway')
+            sg_client = self._get_client('storagegateway', fail_fast=True)
             
             # Create the volume based on type
             if volume_type == 'STORED':
@@ -359,6 +487,8 @@ class StorageGatewayService(BaseService):
                     SourceVolumeARN=''  # Optional
                 )
             
+            self._invalidate_all('list_volumes')
+            
             return {
                 "status": "success",
                 "volume_arn": response['VolumeARN'],